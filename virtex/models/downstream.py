@@ -66,9 +66,11 @@ class FeatureExtractor(nn.Module):
         features = self.visual(images, return_intermediate_outputs=True)
         pooled = self.pool(features[self.layer_name])
 
-        # Perform normalization and flattening of features.
+        # Perform normalization and flattening of features. Use flatten (not
+        # view) because backbone features are in channels-last memory format,
+        # where collapsing (C, H, W) is not a stride-compatible view.
         if self.flatten_and_normalize:
-            pooled = pooled.view(pooled.size(0), -1)
+            pooled = pooled.flatten(start_dim=1)
             pooled = pooled / torch.norm(pooled, dim=-1).unsqueeze(-1)
 
         return pooled
@@ -1,7 +1,11 @@
-from typing import Any, Dict, Union
+import contextlib
+import itertools
+import re
+from typing import Any, Dict, Optional, Tuple, Union
 
 import torch
 from torch import nn
+from torch.nn.utils.fusion import fuse_conv_bn_eval
 import torchvision
 
 
@@ -34,10 +38,12 @@ class BlindVisualBackbone(VisualBackbone):
         super().__init__(visual_feature_size)
 
         # We never update the bias because a blind model cannot learn anything
-        # about the image. Add an axis for proper broadcasting.
-        self._bias = nn.Parameter(
+        # about the image, so it is a buffer (not a parameter) -- excluded
+        # from optimizer traversal and free of autograd bookkeeping. Add an
+        # axis for proper broadcasting.
+        self.register_buffer(
+            "_bias",
             torch.full((1, self.visual_feature_size), fill_value=bias_value),
-            requires_grad=False,
         )
 
     def forward(self, image: torch.Tensor) -> torch.Tensor:
@@ -55,10 +61,11 @@ class BlindVisualBackbone(VisualBackbone):
         -------
         torch.Tensor
             Output visual features, filled with :attr:`bias_value`. A tensor of
-            shape ``(batch_size, visual_feature_size)``.
+            shape ``(batch_size, visual_feature_size)``. This is an expanded
+            view over the constant bias (no copy); callers which modify it
+            in-place must ``.clone()`` first.
         """
-        batch_size = image.size(0)
-        return self._bias.repeat(batch_size, 1)
+        return self._bias.expand(image.shape[0], -1)
 
 
 class TorchvisionVisualBackbone(VisualBackbone):
@@ -77,23 +84,106 @@ class TorchvisionVisualBackbone(VisualBackbone):
         Whether to load ImageNet pretrained weights from Torchvision.
     frozen: float, optional (default = False)
         Whether to keep all weights frozen during training.
+    autocast_dtype: torch.dtype, optional (default = None)
+        If set (for example ``torch.bfloat16``), run the forward pass under
+        :class:`torch.autocast` with this dtype for CUDA inputs, so convs
+        execute on tensor cores at half the memory bandwidth. Output features
+        will be in this dtype; callers should upcast at the loss if needed.
+        Requires ``torch>=1.10``.
+    quantized: bool, optional (default = False)
+        Whether to build the INT8 quantized variant of the model from
+        :mod:`torchvision.models.quantization` instead of the FP32 model.
+        Quantized backbones are eval-only (for example feature extraction
+        with a frozen backbone); returned features are dequantized
+        ``torch.float32``.
     """
 
+    # Maximum number of CUDA graphs (one per input shape) kept alive by
+    # :meth:`enable_cuda_graph`; each holds static input/output tensors.
+    _MAX_CUDA_GRAPHS = 8
+
+    # Models from ``torchvision.models.quantization`` which can back the
+    # ``quantized = True`` path. Only ResNet-style models qualify: the
+    # forward pass taps ``layer1...layer4`` children, which models like
+    # the quantized MobileNets (a single ``features`` child) do not have.
+    _QUANTIZED_MODEL_NAMES = frozenset(
+        {
+            "resnet18",
+            "resnet50",
+            "resnext101_32x8d",
+        }
+    )
+
+    # Detectron2 backbones have slightly different module names, this mapping
+    # lists substrings of module names required to be renamed for loading a
+    # torchvision model into Detectron2. Compiled once into a single regex
+    # alternation (longest substrings first) so every parameter name is
+    # rewritten in one pass in :meth:`detectron2_backbone_state_dict`.
+    DETECTRON2_RENAME_MAPPING: Dict[str, str] = {
+        "layer1": "res2",
+        "layer2": "res3",
+        "layer3": "res4",
+        "layer4": "res5",
+        "bn1": "conv1.norm",
+        "bn2": "conv2.norm",
+        "bn3": "conv3.norm",
+        "downsample.0": "shortcut",
+        "downsample.1": "shortcut.norm",
+    }
+    _DETECTRON2_RENAME_RE = re.compile(
+        "|".join(
+            re.escape(old)
+            for old in sorted(DETECTRON2_RENAME_MAPPING, key=len, reverse=True)
+        )
+    )
+
     def __init__(
         self,
         name: str = "resnet50",
         visual_feature_size: int = 2048,
         pretrained: bool = False,
         frozen: bool = False,
+        autocast_dtype: Optional[torch.dtype] = None,
+        quantized: bool = False,
     ):
         super().__init__(visual_feature_size)
 
-        self.cnn = getattr(torchvision.models, name)(
-            pretrained, zero_init_residual=True
-        )
+        if autocast_dtype is not None and not hasattr(torch, "autocast"):
+            raise RuntimeError(
+                f"autocast_dtype requires torch>=1.10, "
+                f"found {torch.__version__}."
+            )
+        self._autocast_dtype = autocast_dtype
+        self._quantized = quantized
+
+        if quantized:
+            if name not in self._QUANTIZED_MODEL_NAMES:
+                raise ValueError(
+                    f"No quantized variant of {name} in torchvision, "
+                    f"choose from {sorted(self._QUANTIZED_MODEL_NAMES)}."
+                )
+            # FBGEMM provides the INT8 kernels on x86 servers (ARM would
+            # need "qnnpack" instead).
+            import torchvision.models.quantization as qmodels
+
+            torch.backends.quantized.engine = "fbgemm"
+            self.cnn = getattr(qmodels, name)(
+                pretrained=pretrained, quantize=True
+            )
+        else:
+            self.cnn = getattr(torchvision.models, name)(
+                pretrained, zero_init_residual=True
+            )
         # Do nothing after the final residual stage.
         self.cnn.fc = nn.Identity()
 
+        # Keep conv weights in channels-last (NHWC) memory format: cuDNN
+        # dispatches NHWC tensor core kernels for these, avoiding implicit
+        # NCHW <-> NHWC transposes around every conv. Quantized convs pack
+        # their own weight layout, leave them alone.
+        if not quantized:
+            self.cnn = self.cnn.to(memory_format=torch.channels_last)
+
         # Freeze all weights if specified.
         if frozen:
             for param in self.cnn.parameters():
@@ -103,6 +193,55 @@ class TorchvisionVisualBackbone(VisualBackbone):
         # Keep a list of intermediate layer names.
         self._stage_names = [f"layer{i}" for i in range(1, 5)]
 
+        # Cache backbone stages (and positions of intermediate layers) once,
+        # so the forward pass does not repeat ``named_children`` iteration and
+        # string comparisons per call.
+        self._build_children_cache()
+
+        # The forward pass taps these stages and returns ``layer4`` features;
+        # fail loudly for architectures without them rather than silently
+        # returning something else.
+        if not self._tap_positions:
+            raise ValueError(
+                f"{name} has no layer1...layer4 stages, this backbone "
+                f"requires a ResNet-like model."
+            )
+
+        # Reusable container for intermediate outputs, cleared at the start
+        # of every eager forward pass (callers receive a shallow copy).
+        self._taps: Dict[str, torch.Tensor] = {}
+
+        # Optional CUDA graph capture of the forward pass: one captured
+        # graph (with its static input/output tensors) per input shape,
+        # see :meth:`enable_cuda_graph`.
+        self._cuda_graphs_enabled = False
+        self._graphs: Dict[Tuple[int, ...], Any] = {}
+
+    def _build_children_cache(self):
+        r"""
+        Cache children of :attr:`cnn` as a list, and record positions of
+        intermediate stages (``layer1...layer4``) by integer index. We keep a
+        plain list (not :class:`~torch.nn.ModuleList`) because these modules
+        are already registered under :attr:`cnn` -- registering them twice
+        would duplicate keys in state dict.
+        """
+        named_children = [
+            (name, layer)
+            for name, layer in self.cnn.named_children()
+            # Quantization stubs (on quantized models) are applied explicitly
+            # around the loop in forward, not as part of the sequence.
+            if name not in ("quant", "dequant")
+        ]
+        self._children_list = [layer for _, layer in named_children]
+        self._tap_positions = {
+            idx: name
+            for idx, (name, _) in enumerate(named_children)
+            if name in self._stage_names
+        }
+        # Position of the last intermediate stage (``layer4``) -- layers past
+        # it can be skipped when intermediate outputs are not requested.
+        self._last_tap_position = max(self._tap_positions, default=-1)
+
     def forward(
         self, image: torch.Tensor, return_intermediate_outputs: bool = False
     ) -> Union[torch.Tensor, Dict[str, torch.Tensor]]:
@@ -132,23 +271,210 @@ class TorchvisionVisualBackbone(VisualBackbone):
               average pooling layer.
         """
 
-        # Iterate through the modules in sequence and collect feature
-        # vectors for last layers in each stage.
-        intermediate_outputs: Dict[str, torch.Tensor] = {}
-        for idx, (name, layer) in enumerate(self.cnn.named_children()):
-            out = layer(image) if idx == 0 else layer(out)
-            if name in self._stage_names:
-                intermediate_outputs[name] = out
-
-        # Add pooled spatial features.
-        intermediate_outputs["avgpool"] = torch.mean(
-            intermediate_outputs["layer4"], dim=[2, 3]
-        )
+        # Match the memory format of conv weights (see ``__init__``).
+        image = image.contiguous(memory_format=torch.channels_last)
+
+        # Graph replay runs without autograd, so never take it in training
+        # mode (gradients would silently stop at the backbone).
+        if self._cuda_graphs_enabled and image.is_cuda and not self.training:
+            # Replay the graph captured for this input shape, capturing one
+            # on demand so boundary batches (for example the smaller final
+            # batch of an epoch) stay on the graph path. Clone outputs
+            # because static tensors are overwritten on replay.
+            entry = self._graphs.get(tuple(image.shape))
+            if entry is None:
+                entry = self._capture_graph(image)
+            graph, static_input, static_outputs = entry
+            static_input.copy_(image, non_blocking=True)
+            graph.replay()
+            if return_intermediate_outputs:
+                return {name: out.clone() for name, out in static_outputs.items()}
+            return static_outputs["layer4"].clone()
+
         if return_intermediate_outputs:
-            return intermediate_outputs
-        else:
-            # shape: (batch_size, channels, height, width)
-            return intermediate_outputs["layer4"]
+            # Copy so the caller may keep the dict across steps, while the
+            # instance-level container is reused (see ``_run_eager``).
+            return dict(self._run_eager(image))
+
+        # Hot path: thread the tensor through stages up to ``layer4`` without
+        # allocating a dict of intermediate outputs.
+        with self._autocast_context(image):
+            out = self.cnn.quant(image) if self._quantized else image
+            for layer in self._children_list[: self._last_tap_position + 1]:
+                out = layer(out)
+            if self._quantized:
+                out = self.cnn.dequant(out)
+        # shape: (batch_size, channels, height, width)
+        return out
+
+    def _autocast_context(self, image: torch.Tensor):
+        r"""
+        Autocast context for the forward pass -- a no-op unless an
+        ``autocast_dtype`` was configured and the input is on CUDA.
+        """
+        if self._autocast_dtype is not None and image.is_cuda:
+            return torch.autocast(device_type="cuda", dtype=self._autocast_dtype)
+        return contextlib.nullcontext()
+
+    def _run_eager(self, image: torch.Tensor) -> Dict[str, torch.Tensor]:
+        r"""
+        Execute the forward pass eagerly and collect feature vectors for last
+        layers in each stage (and pooled spatial features).
+        """
+        # Reuse the preallocated container instead of allocating a dict per
+        # step; callers which hold on to it get a copy in ``forward``.
+        intermediate_outputs = self._taps
+        intermediate_outputs.clear()
+        with self._autocast_context(image):
+            out = self.cnn.quant(image) if self._quantized else image
+            for idx, layer in enumerate(self._children_list):
+                out = layer(out)
+                name = self._tap_positions.get(idx)
+                if name is not None:
+                    intermediate_outputs[name] = (
+                        self.cnn.dequant(out) if self._quantized else out
+                    )
+
+            # Add pooled spatial features.
+            intermediate_outputs["avgpool"] = torch.mean(
+                intermediate_outputs["layer4"], dim=[2, 3]
+            )
+        return intermediate_outputs
+
+    def enable_cuda_graph(self, sample_input: Optional[torch.Tensor] = None):
+        r"""
+        Capture the forward pass as a `CUDA graph
+        <https://pytorch.org/docs/stable/notes/cuda.html#cuda-graphs>`_ and
+        replay it for subsequent calls, instead of launching every conv/BN
+        kernel separately from Python. One graph is kept per input shape
+        (captured on demand, at most :attr:`_MAX_CUDA_GRAPHS`, evicted
+        oldest-first), so varying batch sizes do not fall off the graph path.
+
+        This is inference-only: the replayed graph does not track autograd
+        history, so it cannot be enabled in training mode, and :meth:`forward`
+        falls back to eager execution if the module is put back in training
+        mode afterwards. Requires ``torch>=1.10``.
+
+        Parameters
+        ----------
+        sample_input: torch.Tensor, optional (default = None)
+            A CUDA tensor matching the shape (and dtype) of images which
+            will be passed to :meth:`forward`. If given, a graph for this
+            shape is captured immediately; otherwise capture happens lazily
+            on the first call per shape.
+        """
+        if not hasattr(torch.cuda, "graph"):
+            raise RuntimeError(
+                f"CUDA graph capture requires torch>=1.10, "
+                f"found {torch.__version__}."
+            )
+        if self.training:
+            raise RuntimeError(
+                "Backbone must be in eval mode before `enable_cuda_graph`, "
+                "replayed graphs do not track autograd history."
+            )
+        self._cuda_graphs_enabled = True
+        if sample_input is not None:
+            self._capture_graph(sample_input)
+
+    def _capture_graph(self, image: torch.Tensor):
+        r"""
+        Capture a CUDA graph for inputs shaped like ``image`` and register
+        it in the shape-keyed cache, evicting the oldest entry when full.
+        Returns a ``(graph, static_input, static_outputs)`` tuple.
+        """
+        static_input = torch.empty_like(image, device="cuda")
+        static_input.copy_(image)
+
+        # Warm up on a side stream so capture does not record one-time
+        # allocator and cuDNN autotuning work.
+        side_stream = torch.cuda.Stream()
+        side_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(side_stream), torch.no_grad():
+            for _ in range(3):
+                self._run_eager(static_input)
+        torch.cuda.current_stream().wait_stream(side_stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph), torch.no_grad():
+            # Copy: ``_run_eager`` returns the reusable taps container,
+            # which later eager calls clear.
+            static_outputs = dict(self._run_eager(static_input))
+
+        if len(self._graphs) >= self._MAX_CUDA_GRAPHS:
+            self._graphs.pop(next(iter(self._graphs)))
+        entry = (graph, static_input, static_outputs)
+        self._graphs[tuple(image.shape)] = entry
+        return entry
+
+    def fuse_for_inference(self, compile: bool = False):
+        r"""
+        Fold every BatchNorm into its preceding conv, in-place. At inference
+        time BatchNorm is an affine transform with frozen statistics, so it
+        can be absorbed into conv weights -- this removes one memory-bound
+        kernel per conv from the forward pass. The BatchNorm modules are
+        replaced with :class:`~torch.nn.Identity`.
+
+        This is irreversible and only valid with frozen BatchNorm statistics:
+        the backbone must be in ``eval`` mode, and fused weights must not be
+        trained further.
+
+        Parameters
+        ----------
+        compile: bool, optional (default = False)
+            Additionally wrap each backbone stage with :func:`torch.compile`
+            (``mode="reduce-overhead"``) so TorchInductor fuses elementwise
+            ops into the convs and captures CUDA graphs automatically. The
+            first forward call after an input shape change triggers a
+            recompile. Requires ``torch>=2.0``.
+        """
+        if self.training:
+            raise RuntimeError(
+                "Backbone must be in eval mode before `fuse_for_inference`, "
+                "fused weights are only valid with frozen BatchNorm stats."
+            )
+        self._fuse_conv_bn(self.cnn)
+
+        # The stem BN was replaced with Identity, refresh cached children.
+        self._build_children_cache()
+
+        if compile:
+            if not hasattr(torch, "compile"):
+                raise RuntimeError(
+                    f"fuse_for_inference(compile=True) requires torch>=2.0, "
+                    f"found {torch.__version__}."
+                )
+            # Compile stages one by one: the forward pass taps intermediate
+            # stage outputs, so the trunk cannot be compiled as one opaque
+            # module. Compiled wrappers live only in the cached children
+            # list; the original modules stay registered under ``self.cnn``,
+            # keeping state dict keys unchanged.
+            self._children_list = [
+                torch.compile(layer, mode="reduce-overhead", dynamic=False)
+                for layer in self._children_list
+            ]
+
+    def _fuse_conv_bn(self, module: nn.Module):
+        r"""
+        Recursively fuse ``(Conv2d, BatchNorm2d)`` pairs of adjacent children
+        in ``module``. This covers stem ``(conv1, bn1)``, all three pairs in
+        bottleneck blocks, and ``downsample`` shortcuts.
+        """
+        child_names = [name for name, _ in module.named_children()]
+        for conv_name, bn_name in zip(child_names, child_names[1:]):
+            conv = getattr(module, conv_name)
+            bn = getattr(module, bn_name)
+            if isinstance(conv, nn.Conv2d) and isinstance(bn, nn.BatchNorm2d):
+                if bn.training or not bn.track_running_stats:
+                    raise RuntimeError(
+                        f"Cannot fuse BatchNorm {bn_name}: it is in training "
+                        f"mode or does not track running stats."
+                    )
+                setattr(module, conv_name, fuse_conv_bn_eval(conv, bn))
+                setattr(module, bn_name, nn.Identity())
+
+        for child in module.children():
+            self._fuse_conv_bn(child)
 
     def detectron2_backbone_state_dict(self) -> Dict[str, Any]:
         r"""
@@ -165,32 +491,24 @@ class TorchvisionVisualBackbone(VisualBackbone):
             These are necessary keys for loading this state dict properly with
             Detectron2.
         """
-        # Detectron2 backbones have slightly different module names, this mapping
-        # lists substrings of module names required to be renamed for loading a
-        # torchvision model into Detectron2.
-        DETECTRON2_RENAME_MAPPING: Dict[str, str] = {
-            "layer1": "res2",
-            "layer2": "res3",
-            "layer3": "res4",
-            "layer4": "res5",
-            "bn1": "conv1.norm",
-            "bn2": "conv2.norm",
-            "bn3": "conv3.norm",
-            "downsample.0": "shortcut",
-            "downsample.1": "shortcut.norm",
-        }
-        # Populate this dict by renaming module names.
+        # Populate this dict by renaming module names, all substitutions
+        # from :attr:`DETECTRON2_RENAME_MAPPING` applied in a single pass.
+        # Stream parameters and buffers directly instead of materializing
+        # a full ``state_dict()``; values are detached views, not copies.
+        rename_mapping = self.DETECTRON2_RENAME_MAPPING
         d2_backbone_dict: Dict[str, torch.Tensor] = {}
 
-        for name, param in self.cnn.state_dict().items():
-            for old, new in DETECTRON2_RENAME_MAPPING.items():
-                name = name.replace(old, new)
-
+        for name, tensor in itertools.chain(
+            self.cnn.named_parameters(), self.cnn.named_buffers()
+        ):
+            name = self._DETECTRON2_RENAME_RE.sub(
+                lambda match: rename_mapping[match.group(0)], name
+            )
             # First conv and bn module parameters are prefixed with "stem.".
             if not name.startswith("res"):
                 name = f"stem.{name}"
 
-            d2_backbone_dict[name] = param
+            d2_backbone_dict[name] = tensor.detach()
 
         return {
             "model": d2_backbone_dict,